@@ -5,31 +5,178 @@ Author: Assistant
 Version: 1.0
 """
 
+import argparse
+import csv
 import requests
+import charset_normalizer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-import json
+import html
+import io
 import os
 import sys
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from urllib.parse import urlparse, urljoin
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 try:
-    from bs4 import BeautifulSoup
+    from selectolax.lexbor import LexborHTMLParser
     from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+    from cachetools import LRUCache, TTLCache, cached
+    from cachetools.keys import hashkey
+    import orjson
 except ImportError:
     print("Missing required packages. Please install them using:")
-    print("pip install requests beautifulsoup4 fpdf2")
+    print("pip install requests selectolax fpdf2 cachetools orjson")
     sys.exit(1)
 
 
+# Matches script and style elements including their contents
+_STRIP_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1>', re.IGNORECASE | re.DOTALL)
+
+# Matches HTML comments, which may contain quotes and '>' of their own
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# Matches any markup tag; quoted attribute values (only after '=' in a start
+# tag) may contain '>'. Used to reduce raw HTML to its text content
+_TAG_RE = re.compile(r'<(?:[a-zA-Z](?:=\s*"[^"]*"|=\s*\'[^\']*\'|[^>])*|[/!?][^>]*)>')
+
+
+# Tag-based elements the analyzers inspect, matched in a single tree walk
+_COLLECT_SELECTOR = 'title, meta[name="description"], h1, h2, h3, h4, h5, h6, img, script[type="application/ld+json"]'
+
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Characters pages commonly write as HTML entities
+_ENTITY_CHARS = frozenset('&<>"\'')
+
+_ITEMSCOPE_SELECTOR = '[itemscope]'
+_TYPEOF_SELECTOR = '[typeof]'
+
+# Audited URLs must be absolute http(s) URLs
+_URL_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+# Concurrent audits when running a --batch CSV
+_BATCH_WORKERS = 8
+
+# Branding logo placed at the bottom of every PDF report
+_LOGO_PATH = "lo.png"
+
+# Fetched pages are reused for this many seconds
+_PAGE_CACHE_TTL = 300
+
+# Pages larger than this are rejected rather than loaded into memory
+_MAX_PAGE_BYTES = 10_000_000
+
+
+@dataclass(slots=True)
+class KeywordFrequency:
+    total: int
+    title: int
+    headings: int
+    body: int
+
+
+@dataclass(slots=True)
+class H1Result:
+    count: int
+    texts: List[str]
+    status: str
+
+
+@dataclass(slots=True)
+class ImageResult:
+    total_images: int
+    missing_alt: int
+    with_alt: int
+
+
+@dataclass(slots=True)
+class SchemaResult:
+    has_schema: bool
+    json_ld_count: int
+    microdata_count: int
+    rdfa_count: int
+    schema_types: List[str]
+
+
+@dataclass(slots=True)
+class PageSpeedResult:
+    performance_score: int
+    fcp: str
+    fcp_numeric: float
+
+
+def _visible_text(html_content: str) -> str:
+    """Return page text with script/style blocks and markup removed and entities decoded"""
+    return html.unescape(_TAG_RE.sub('', _STRIP_RE.sub('', _COMMENT_RE.sub('', html_content))))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_logo() -> Optional[bytes]:
+    """Read the report logo once per process; None when the file is missing"""
+    if not os.path.exists(_LOGO_PATH):
+        return None
+    with open(_LOGO_PATH, 'rb') as f:
+        return f.read()
+
+
+# The session only carries the connection pool, so it is left out of the key;
+# this lets every SEOAuditTool share results without keeping sessions alive
+@cached(LRUCache(maxsize=64), key=lambda session, api_key, url: hashkey(api_key, url), lock=threading.Lock())
+def _pagespeed_cached(session: requests.Session, api_key: str, url: str) -> PageSpeedResult:
+    """Fetch PageSpeed Insights data, memoized per API key and URL for the process lifetime"""
+    api_url = f"https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+    params = {
+        'url': url,
+        'key': api_key,
+        'category': 'performance'
+    }
+    
+    response = session.get(api_url, params=params, timeout=60)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    
+    lighthouse_result = data.get('lighthouseResult', {})
+    categories = lighthouse_result.get('categories', {})
+    performance = categories.get('performance', {})
+    
+    audits = lighthouse_result.get('audits', {})
+    fcp_audit = audits.get('first-contentful-paint', {})
+    
+    return PageSpeedResult(
+        performance_score=int(performance.get('score', 0) * 100) if performance.get('score') else 0,
+        fcp=fcp_audit.get('displayValue', 'N/A'),
+        fcp_numeric=fcp_audit.get('numericValue', 0)
+    )
+
+
 class SEOAuditTool:
+    __slots__ = ('api_key', 'session', '_page_cache', '_page_cache_lock')
+
     def __init__(self):
         self.api_key = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Keep-alive pool shared by page fetches and PageSpeed API calls
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._page_cache = TTLCache(maxsize=16, ttl=_PAGE_CACHE_TTL)
+        self._page_cache_lock = threading.Lock()
 
     def display_welcome(self):
         """Display welcome message and tool information"""
@@ -96,107 +243,168 @@ class SEOAuditTool:
         else:
             print("⚠️  No API Key provided. PageSpeed analysis will be skipped.")
 
-    def get_page_content(self, url: str) -> Tuple[Optional[BeautifulSoup], Optional[str]]:
+    def _fetch_html(self, url: str) -> str:
+        """Return webpage HTML, cached per URL for _PAGE_CACHE_TTL seconds"""
+        with self._page_cache_lock:
+            html_content = self._page_cache.get(url)
+        if html_content is None:
+            # Failed downloads raise here and are never cached
+            html_content = self._download_html(url)
+            with self._page_cache_lock:
+                self._page_cache[url] = html_content
+        return html_content
+
+    def _download_html(self, url: str) -> str:
+        """Download webpage HTML, rejecting bodies over _MAX_PAGE_BYTES"""
+        too_large = f"Page exceeds the {_MAX_PAGE_BYTES // 1_000_000} MB size limit"
+        
+        with self.session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            if int(response.headers.get('Content-Length') or 0) > _MAX_PAGE_BYTES:
+                raise ValueError(too_large)
+            
+            # Read in bounded chunks so oversized bodies are never fully buffered
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(65536):
+                total += len(chunk)
+                if total > _MAX_PAGE_BYTES:
+                    raise ValueError(too_large)
+                chunks.append(chunk)
+            
+            content = b''.join(chunks)
+            encoding = response.encoding
+            if encoding is None:
+                # No charset from the headers; detect it like response.text does
+                best_match = charset_normalizer.from_bytes(content).best()
+                encoding = best_match.encoding if best_match else 'utf-8'
+            try:
+                return str(content, encoding, errors='replace')
+            except LookupError:
+                return str(content, 'utf-8', errors='replace')
+
+    def get_page_content(self, url: str) -> Tuple[Optional[LexborHTMLParser], Optional[str]]:
         """Fetch and parse webpage content"""
         try:
             print(f"🌐 Fetching content from: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            return soup, response.text
+            html_content = self._fetch_html(url)
+            return LexborHTMLParser(html_content), html_content
             
         except requests.exceptions.RequestException as e:
             print(f"❌ Error fetching URL: {str(e)}")
             return None, None
+        except ValueError as e:
+            print(f"❌ {str(e)}")
+            return None, None
         except Exception as e:
             print(f"❌ Unexpected error: {str(e)}")
             return None, None
 
-    def extract_title_tag(self, soup: BeautifulSoup) -> str:
+    def extract_title_tag(self, elements: Dict[str, list]) -> str:
         """Extract title tag from webpage"""
-        title_tag = soup.find('title')
-        return title_tag.get_text().strip() if title_tag else "No title tag found"
+        title_tag = elements['title'][0] if elements['title'] else None
+        return title_tag.text().strip() if title_tag else "No title tag found"
 
-    def extract_meta_description(self, soup: BeautifulSoup) -> str:
+    def extract_meta_description(self, elements: Dict[str, list]) -> str:
         """Extract meta description from webpage"""
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc.get('content').strip()
+        meta_desc = elements['meta_description'][0] if elements['meta_description'] else None
+        if meta_desc and meta_desc.attributes.get('content'):
+            return meta_desc.attributes.get('content').strip()
         return "No meta description found"
 
-    def calculate_keyword_frequency(self, html_content: str, keyword: str) -> Dict[str, int]:
+    def collect_elements(self, tree: LexborHTMLParser) -> Dict[str, list]:
+        """Group the nodes needed by the analyzers using one CSS pass over the tree"""
+        elements = {'title': [], 'meta_description': [], 'headings': [], 'h1': [], 'img': [], 'json_ld': []}
+        
+        # Classify by tag only; reading node attributes in Python costs more
+        # than letting lexbor match the attribute selectors below
+        for node in tree.css(_COLLECT_SELECTOR):
+            tag = node.tag
+            if tag in _HEADING_TAGS:
+                elements['headings'].append(node)
+                if tag == 'h1':
+                    elements['h1'].append(node)
+            elif tag == 'img':
+                elements['img'].append(node)
+            elif tag == 'title':
+                elements['title'].append(node)
+            elif tag == 'meta':
+                elements['meta_description'].append(node)
+            else:
+                elements['json_ld'].append(node)
+        
+        elements['itemscope'] = tree.css(_ITEMSCOPE_SELECTOR)
+        elements['typeof'] = tree.css(_TYPEOF_SELECTOR)
+        return elements
+
+    def calculate_keyword_frequency(self, elements: Dict[str, list], html_content: str, keyword: str) -> KeywordFrequency:
         """Calculate keyword frequency in different parts of the page"""
-        if not html_content or not keyword:
-            return {'total': 0, 'title': 0, 'headings': 0, 'body': 0}
+        if not elements or not html_content or not keyword:
+            return KeywordFrequency(total=0, title=0, headings=0, body=0)
 
-        soup = BeautifulSoup(html_content, 'html.parser')
         keyword_lower = keyword.lower()
         
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # A plain ASCII keyword is written literally in the markup, so if the
+        # raw HTML lacks it no section can contain it and stripping is skipped.
+        # Keywords with entity-escapable characters may only appear encoded.
+        if keyword_lower.isascii() and not _ENTITY_CHARS.intersection(keyword_lower):
+            if keyword_lower not in html_content.lower():
+                return KeywordFrequency(total=0, title=0, headings=0, body=0)
         
-        # Get all text content
-        all_text = soup.get_text().lower()
-        total_count = all_text.count(keyword_lower)
+        # Single C-level scan over the cleaned text; no DOM text is built
+        total_count = _visible_text(html_content).lower().count(keyword_lower)
         
         # Title count
-        title_text = soup.find('title')
-        title_count = title_text.get_text().lower().count(keyword_lower) if title_text else 0
+        title_text = elements['title'][0] if elements['title'] else None
+        title_count = title_text.text().lower().count(keyword_lower) if title_text else 0
         
         # Headings count (h1-h6)
-        headings_text = ' '.join([h.get_text().lower() for h in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])])
+        headings_text = ' '.join(h.text() for h in elements['headings']).lower()
         headings_count = headings_text.count(keyword_lower)
         
         # Body count (excluding title and headings)
         body_count = max(0, total_count - title_count - headings_count)
         
-        return {
-            'total': total_count,
-            'title': title_count,
-            'headings': headings_count,
-            'body': body_count
-        }
+        return KeywordFrequency(
+            total=total_count,
+            title=title_count,
+            headings=headings_count,
+            body=body_count
+        )
 
-    def analyze_h1_tags(self, soup: BeautifulSoup) -> Dict[str, any]:
+    def analyze_h1_tags(self, elements: Dict[str, list]) -> H1Result:
         """Analyze H1 tags on the page"""
-        h1_tags = soup.find_all('h1')
-        h1_texts = [h1.get_text().strip() for h1 in h1_tags]
-        
-        return {
-            'count': len(h1_tags),
-            'texts': h1_texts,
-            'status': 'Good' if len(h1_tags) == 1 else 'Warning | It is generally recommended to only use one H1 Tag on a page.' if len(h1_tags) > 1 else 'Missing'
-        }
+        h1_tags = elements['h1']
+        h1_texts = [h1.text().strip() for h1 in h1_tags]
+        
+        return H1Result(
+            count=len(h1_tags),
+            texts=h1_texts,
+            status='Good' if len(h1_tags) == 1 else 'Warning | It is generally recommended to only use one H1 Tag on a page.' if len(h1_tags) > 1 else 'Missing'
+        )
 
-    def analyze_images(self, soup: BeautifulSoup, base_url: str) -> Dict[str, int]:
+    def analyze_images(self, elements: Dict[str, list], base_url: str) -> ImageResult:
         """Analyze images and ALT tags"""
-        images = soup.find_all('img')
+        images = elements['img']
         total_images = len(images)
-        missing_alt = 0
+        missing_alt = sum(1 for img in images if not (img.attributes.get('alt') or '').strip())
         
-        for img in images:
-            alt_text = img.get('alt', '').strip()
-            if not alt_text:
-                missing_alt += 1
-        
-        return {
-            'total_images': total_images,
-            'missing_alt': missing_alt,
-            'with_alt': total_images - missing_alt
-        }
+        return ImageResult(
+            total_images=total_images,
+            missing_alt=missing_alt,
+            with_alt=total_images - missing_alt
+        )
 
-    def check_schema_markup(self, soup: BeautifulSoup) -> Dict[str, any]:
+    def check_schema_markup(self, elements: Dict[str, list]) -> SchemaResult:
         """Check for schema markup presence"""
         # Check for JSON-LD
-        json_ld = soup.find_all('script', type='application/ld+json')
+        json_ld = elements['json_ld']
         
         # Check for microdata
-        microdata = soup.find_all(attrs={'itemscope': True})
+        microdata = elements['itemscope']
         
         # Check for RDFa
-        rdfa = soup.find_all(attrs={'typeof': True})
+        rdfa = elements['typeof']
         
         has_schema = len(json_ld) > 0 or len(microdata) > 0 or len(rdfa) > 0
         
@@ -205,55 +413,33 @@ class SEOAuditTool:
         # Extract schema types from JSON-LD
         for script in json_ld:
             try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and '@type' in data:
-                    schema_types.append(data['@type'])
-                elif isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict) and '@type' in item:
-                            schema_types.append(item['@type'])
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(script.text())
+                items = data if isinstance(data, list) else [data]
+                for item in items:
+                    if isinstance(item, dict) and '@type' in item:
+                        # @type may itself be a list, e.g. ["Organization", "LocalBusiness"];
+                        # anything that is not a plain type name is ignored
+                        t = item['@type']
+                        schema_types.extend(x for x in (t if isinstance(t, list) else [t]) if isinstance(x, str))
+            except (orjson.JSONDecodeError, TypeError):
                 continue
         
-        return {
-            'has_schema': has_schema,
-            'json_ld_count': len(json_ld),
-            'microdata_count': len(microdata),
-            'rdfa_count': len(rdfa),
-            'schema_types': list(set(schema_types))
-        }
+        return SchemaResult(
+            has_schema=has_schema,
+            json_ld_count=len(json_ld),
+            microdata_count=len(microdata),
+            rdfa_count=len(rdfa),
+            schema_types=list(dict.fromkeys(schema_types))  # Dedupe, keeping first-seen order
+        )
 
-    def get_pagespeed_insights(self, url: str) -> Optional[Dict[str, any]]:
+    def get_pagespeed_insights(self, url: str) -> Optional[PageSpeedResult]:
         """Get PageSpeed Insights data from Google API"""
         if not self.api_key:
             return None
         
         try:
             print("⚡ Analyzing PageSpeed Performance...")
-            api_url = f"https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
-            params = {
-                'url': url,
-                'key': self.api_key,
-                'category': 'performance'
-            }
-            
-            response = requests.get(api_url, params=params, timeout=60)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            lighthouse_result = data.get('lighthouseResult', {})
-            categories = lighthouse_result.get('categories', {})
-            performance = categories.get('performance', {})
-            
-            audits = lighthouse_result.get('audits', {})
-            fcp_audit = audits.get('first-contentful-paint', {})
-            
-            return {
-                'performance_score': int(performance.get('score', 0) * 100) if performance.get('score') else 0,
-                'fcp': fcp_audit.get('displayValue', 'N/A'),
-                'fcp_numeric': fcp_audit.get('numericValue', 0)
-            }
+            return _pagespeed_cached(self.session, self.api_key, url)
             
         except requests.exceptions.RequestException as e:
             print(f"⚠️  PageSpeed API Error: {str(e)}")
@@ -269,7 +455,7 @@ class SEOAuditTool:
         
         # Get URL
         url = input("Enter website URL (with https://): ").strip()
-        if not url.startswith(('http://', 'https://')):
+        if not _URL_RE.match(url):
             print("❌ Please enter a valid URL starting with http:// or https://")
             return
         
@@ -279,47 +465,115 @@ class SEOAuditTool:
             print("❌ Keyword cannot be empty")
             return
         
+        self.run_audit_once(url, keyword)
+        
+        input("\nPress Enter to return to main menu...")
+
+    def run_audit_once(self, url: str, keyword: str, output: Optional[str] = None, show_results: bool = True) -> bool:
+        """Audit a single URL without prompting and save the PDF report"""
+        if not _URL_RE.match(url):
+            print(f"❌ Invalid URL '{url}': it must start with http:// or https://")
+            return False
+        if not keyword:
+            print(f"❌ Keyword cannot be empty (URL: {url})")
+            return False
+        
         print(f"\n🚀 Starting SEO audit for: {url}")
         print(f"🎯 Target keyword: '{keyword}'")
         print("-" * 50)
         
-        # Fetch page content
-        soup, html_content = self.get_page_content(url)
-        if not soup:
-            return
+        results = self.audit_url(url, keyword)
+        if not results:
+            return False
         
-        # Extract domain for filename
-        domain = urlparse(url).netloc.replace('www.', '')
+        # Display results
+        if show_results:
+            self.display_results(results)
         
-        # Perform all analyses
-        print("📊 Analyzing SEO elements...")
+        # Generate PDF report
+        pdf_filename = output or f"SEO_Audit_Report_{results['domain']}.pdf"
+        if self.generate_pdf_report(results, pdf_filename):
+            print(f"\n✅ Audit completed successfully!")
+            print(f"📄 PDF report saved as: {pdf_filename}")
+            return True
         
-        results = {
+        print("\n⚠️  Audit completed but PDF generation failed.")
+        return False
+
+    def audit_url(self, url: str, keyword: str) -> Optional[Dict]:
+        """Fetch a page and run every analysis on it"""
+        # Fetch page content and PageSpeed data concurrently; leaving the
+        # block waits for PageSpeed, so no request outlives the audit
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pagespeed_future = executor.submit(self.get_pagespeed_insights, url)
+            
+            tree, html_content = self.get_page_content(url)
+            if tree:
+                # Extract domain for filename
+                domain = urlparse(url).netloc.replace('www.', '')
+                
+                # Perform all analyses
+                print("📊 Analyzing SEO elements...")
+                
+                elements = self.collect_elements(tree)
+                
+                # All tree queries happen in collect_elements on this thread; the
+                # workers only read the collected nodes, never the parser's selector
+                futures = {
+                    'title_tag': executor.submit(self.extract_title_tag, elements),
+                    'meta_description': executor.submit(self.extract_meta_description, elements),
+                    'keyword_frequency': executor.submit(self.calculate_keyword_frequency, elements, html_content, keyword),
+                    'h1_analysis': executor.submit(self.analyze_h1_tags, elements),
+                    'image_analysis': executor.submit(self.analyze_images, elements, url),
+                    'schema_analysis': executor.submit(self.check_schema_markup, elements)
+                }
+        
+        if not tree:
+            return None
+        
+        return {
             'url': url,
             'keyword': keyword,
             'domain': domain,
             'audit_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'title_tag': self.extract_title_tag(soup),
-            'meta_description': self.extract_meta_description(soup),
-            'keyword_frequency': self.calculate_keyword_frequency(html_content, keyword),
-            'h1_analysis': self.analyze_h1_tags(soup),
-            'image_analysis': self.analyze_images(soup, url),
-            'schema_analysis': self.check_schema_markup(soup),
-            'pagespeed_data': self.get_pagespeed_insights(url)
+            **{key: future.result() for key, future in futures.items()},
+            'pagespeed_data': pagespeed_future.result()
         }
+
+    def run_batch(self, csv_path: str, output_dir: Optional[str] = None) -> bool:
+        """Audit every url,keyword row of a CSV file concurrently"""
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                # Skip blank lines and an optional "url,keyword" header row
+                rows = [row for row in csv.reader(f) if row and row[0].strip() and row[0].strip().lower() != 'url']
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"❌ Could not read batch file: {str(e)}")
+            return False
         
-        # Display results
-        self.display_results(results)
+        output_dir = output_dir or '.'
+        os.makedirs(output_dir, exist_ok=True)
         
-        # Generate PDF report
-        pdf_filename = f"SEO_Audit_Report_{domain}.pdf"
-        if self.generate_pdf_report(results, pdf_filename):
-            print(f"\n✅ Audit completed successfully!")
-            print(f"📄 PDF report saved as: {pdf_filename}")
-        else:
-            print("\n⚠️  Audit completed but PDF generation failed.")
+        def audit_row(index: int, row: List[str]) -> bool:
+            url = row[0].strip()
+            keyword = row[1].strip() if len(row) > 1 else ''
+            # A failing row must not abort the rest of the batch
+            try:
+                # Number the reports so several pages of one domain do not collide
+                domain = urlparse(url).netloc.replace('www.', '')
+                pdf_filename = os.path.join(output_dir, f"SEO_Audit_Report_{domain}_{index}.pdf")
+                return self.run_audit_once(url, keyword, pdf_filename, show_results=False)
+            except Exception as e:
+                print(f"❌ Audit failed for {url}: {str(e)}")
+                return False
         
-        input("\nPress Enter to return to main menu...")
+        print(f"📦 Auditing {len(rows)} URLs from {csv_path}...")
+        
+        # Audits are network-bound, so threads overlap their waiting time
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+            outcomes = list(executor.map(audit_row, range(1, len(rows) + 1), rows))
+        
+        print(f"\n📦 Batch finished: {sum(outcomes)}/{len(outcomes)} audits succeeded")
+        return all(outcomes)
 
     def display_results(self, results: Dict):
         """Display audit results in console"""
@@ -343,42 +597,42 @@ class SEOAuditTool:
         # Keyword Frequency
         kf = results['keyword_frequency']
         print(f"🔍 Keyword Frequency:")
-        print(f"   Total occurrences: {kf['total']}")
-        print(f"   In title: {kf['title']}")
-        print(f"   In headings: {kf['headings']}")
-        print(f"   In body: {kf['body']}")
+        print(f"   Total occurrences: {kf.total}")
+        print(f"   In title: {kf.title}")
+        print(f"   In headings: {kf.headings}")
+        print(f"   In body: {kf.body}")
         
         # H1 Analysis
         h1 = results['h1_analysis']
         print(f"📊 H1 Tags Analysis:")
-        print(f"   Count: {h1['count']} ({h1['status']})")
-        if h1['texts']:
-            for i, h1_text in enumerate(h1['texts'], 1):
+        print(f"   Count: {h1.count} ({h1.status})")
+        if h1.texts:
+            for i, h1_text in enumerate(h1.texts, 1):
                 print(f"   H1 {i}: {h1_text[:60]}{'...' if len(h1_text) > 60 else ''}")
         
         # Images
         img = results['image_analysis']
         print(f"🖼️  Images Analysis:")
-        print(f"   Total images: {img['total_images']}")
-        print(f"   With ALT tags: {img['with_alt']}")
-        print(f"   Missing ALT tags: {img['missing_alt']}")
+        print(f"   Total images: {img.total_images}")
+        print(f"   With ALT tags: {img.with_alt}")
+        print(f"   Missing ALT tags: {img.missing_alt}")
         
         # Schema Markup
         schema = results['schema_analysis']
         print(f"🏗️  Schema Markup:")
-        print(f"   Present: {'Yes' if schema['has_schema'] else 'No'}")
-        if schema['has_schema']:
-            print(f"   JSON-LD: {schema['json_ld_count']}")
-            print(f"   Microdata: {schema['microdata_count']}")
-            if schema['schema_types']:
-                print(f"   Schema Types: {', '.join(schema['schema_types'])}")
+        print(f"   Present: {'Yes' if schema.has_schema else 'No'}")
+        if schema.has_schema:
+            print(f"   JSON-LD: {schema.json_ld_count}")
+            print(f"   Microdata: {schema.microdata_count}")
+            if schema.schema_types:
+                print(f"   Schema Types: {', '.join(schema.schema_types)}")
         
         # PageSpeed
         if results['pagespeed_data']:
             ps = results['pagespeed_data']
             print(f"⚡ PageSpeed Performance:")
-            print(f"   Performance Score: {ps['performance_score']}/100")
-            print(f"   First Contentful Paint: {ps['fcp']}")
+            print(f"   Performance Score: {ps.performance_score}/100")
+            print(f"   First Contentful Paint: {ps.fcp}")
         else:
             print("⚡ PageSpeed Performance: Not available (API key not provided)")
 
@@ -387,8 +641,6 @@ class SEOAuditTool:
         try:
             print("📄 Generating PDF report...")
             
-            from fpdf import FPDF
-            
             pdf = FPDF()
             pdf.add_page()
             
@@ -398,165 +650,77 @@ class SEOAuditTool:
             pdf.cell(0, 10, 'SEO AUDIT REPORT', 0, 1, 'C')
             pdf.ln(5)
             
-            # Basic Info Section
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'WEBSITE INFORMATION', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
-            
-            # Split long URLs into multiple lines
-            url_parts = results['url'].replace('https://', '').replace('http://', '')
-            if len(url_parts) > 50:
-                pdf.cell(0, 6, 'Website:', 0, 1)
-                pdf.cell(0, 6, f"  {url_parts[:50]}", 0, 1)
-                if len(url_parts) > 50:
-                    pdf.cell(0, 6, f"  {url_parts[50:]}", 0, 1)
-            else:
-                pdf.cell(0, 6, f"Website: {url_parts}", 0, 1)
-            
-            pdf.cell(0, 6, f"Keyword: {results['keyword']}", 0, 1)
-            pdf.cell(0, 6, f"Date: {results['audit_date']}", 0, 1)
-            pdf.ln(8)
-            
-            # Title Analysis
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'TITLE TAG ANALYSIS | Optimal length (between 50 and 60 characters).', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
-            
-            # Break title into multiple lines if too long
             title = results['title_tag']
-            if len(title) > 70:
-                pdf.cell(0, 6, 'Title:', 0, 1)
-                words = title.split()
-                line = ""
-                for word in words:
-                    if len(line + word) < 65:
-                        line += word + " "
-                    else:
-                        pdf.cell(0, 6, f"  {line.strip()}", 0, 1)
-                        line = word + " "
-                if line.strip():
-                    pdf.cell(0, 6, f"  {line.strip()}", 0, 1)
-            else:
-                pdf.cell(0, 6, f"Title: {title}", 0, 1)
-            
-            pdf.cell(0, 6, f"Length: {len(title)} characters", 0, 1)
-            pdf.ln(6)
-            
-            # Meta Description Analysis
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'META DESCRIPTION ANALYSIS', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
-            
-            # Break description into multiple lines
             desc = results['meta_description']
-            if len(desc) > 70:
-                pdf.cell(0, 6, 'Description:', 0, 1)
-                words = desc.split()
-                line = ""
-                for word in words:
-                    if len(line + word) < 65:
-                        line += word + " "
-                    else:
-                        pdf.cell(0, 6, f"  {line.strip()}", 0, 1)
-                        line = word + " "
-                if line.strip():
-                    pdf.cell(0, 6, f"  {line.strip()}", 0, 1)
-            else:
-                pdf.cell(0, 6, f"Description: {desc}", 0, 1)
-            
-            pdf.cell(0, 6, f"Length: {len(desc)} characters", 0, 1)
-            pdf.ln(6)
-            
-            # Keyword Frequency
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'KEYWORD FREQUENCY', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
-            
             kf = results['keyword_frequency']
-            pdf.cell(0, 6, f"Total Occurrences: {kf['total']}", 0, 1)
-            pdf.cell(0, 6, f"In Title: {kf['title']}", 0, 1)
-            pdf.cell(0, 6, f"In Headings: {kf['headings']}", 0, 1)
-            pdf.cell(0, 6, f"In Body Text: {kf['body']}", 0, 1)
-            pdf.ln(6)
-            
-            # H1 Tags Analysis
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'H1 TAGS ANALYSIS', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
-            
             h1 = results['h1_analysis']
-            pdf.cell(0, 6, f"H1 Count: {h1['count']}", 0, 1)
-            pdf.cell(0, 6, f"Status: {h1['status']}", 0, 1)
-            
-            for i, h1_text in enumerate(h1['texts'], 1):
-                pdf.cell(0, 6, f"H1 #{i}:", 0, 1)
-                # Break H1 text into lines
-                if len(h1_text) > 60:
-                    words = h1_text.split()
-                    line = ""
-                    for word in words:
-                        if len(line + word) < 55:
-                            line += word + " "
-                        else:
-                            pdf.cell(0, 6, f"  {line.strip()}", 0, 1)
-                            line = word + " "
-                    if line.strip():
-                        pdf.cell(0, 6, f"  {line.strip()}", 0, 1)
-                else:
-                    pdf.cell(0, 6, f"  {h1_text}", 0, 1)
-            pdf.ln(6)
-            
-            # Images Analysis
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'IMAGES ANALYSIS', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
-            
             img = results['image_analysis']
-            pdf.cell(0, 6, f"Total Images: {img['total_images']}", 0, 1)
-            pdf.cell(0, 6, f"With ALT Tags: {img['with_alt']}", 0, 1)
-            pdf.cell(0, 6, f"Missing ALT Tags: {img['missing_alt']}", 0, 1)
-            pdf.ln(6)
-            
-            # Schema Markup
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'SCHEMA MARKUP', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
-            
             schema = results['schema_analysis']
-            pdf.cell(0, 6, f"Schema Present: {'Yes' if schema['has_schema'] else 'No'}", 0, 1)
-            
-            if schema['has_schema']:
-                pdf.cell(0, 6, f"JSON-LD Scripts: {schema['json_ld_count']}", 0, 1)
-                pdf.cell(0, 6, f"Microdata: {schema['microdata_count']}", 0, 1)
-                if schema['schema_types']:
-                    pdf.cell(0, 6, 'Schema Types:', 0, 1)
-                    for schema_type in schema['schema_types'][:5]:  # Limit to 5 types
-                        pdf.cell(0, 6, f"  - {schema_type}", 0, 1)
-            pdf.ln(6)
-            
-            # PageSpeed Performance
-            pdf.set_font('Helvetica', 'B', 12)
-            pdf.cell(0, 8, 'PAGESPEED PERFORMANCE', 0, 1)
-            pdf.set_font('Helvetica', '', 10)
-            pdf.ln(2)
+            ps = results['pagespeed_data']
             
-            if results['pagespeed_data']:
-                ps = results['pagespeed_data']
-                pdf.cell(0, 6, f"Performance Score: {ps['performance_score']}/100", 0, 1)
-                pdf.cell(0, 6, f"First Contentful Paint: {ps['fcp']}", 0, 1)
+            schema_lines = [f"Schema Present: {'Yes' if schema.has_schema else 'No'}"]
+            if schema.has_schema:
+                schema_lines += [
+                    f"JSON-LD Scripts: {schema.json_ld_count}",
+                    f"Microdata: {schema.microdata_count}"
+                ]
+                if schema.schema_types:
+                    schema_lines.append('Schema Types:')
+                    schema_lines += [f"  - {schema_type}" for schema_type in schema.schema_types[:5]]  # Limit to 5 types
+            
+            if ps:
+                pagespeed_lines = [
+                    f"Performance Score: {ps.performance_score}/100",
+                    f"First Contentful Paint: {ps.fcp}"
+                ]
             else:
-                pdf.cell(0, 6, "PageSpeed data not available", 0, 1)
-                pdf.cell(0, 6, "(API key not provided)", 0, 1)
+                pagespeed_lines = ["PageSpeed data not available", "(API key not provided)"]
+            
+            sections = [
+                ('WEBSITE INFORMATION', [
+                    f"Website: {results['url'].replace('https://', '').replace('http://', '')}",
+                    f"Keyword: {results['keyword']}",
+                    f"Date: {results['audit_date']}"
+                ]),
+                ('TITLE TAG ANALYSIS | Optimal length (between 50 and 60 characters).', [
+                    f"Title: {title}",
+                    f"Length: {len(title)} characters"
+                ]),
+                ('META DESCRIPTION ANALYSIS', [
+                    f"Description: {desc}",
+                    f"Length: {len(desc)} characters"
+                ]),
+                ('KEYWORD FREQUENCY', [
+                    f"Total Occurrences: {kf.total}",
+                    f"In Title: {kf.title}",
+                    f"In Headings: {kf.headings}",
+                    f"In Body Text: {kf.body}"
+                ]),
+                ('H1 TAGS ANALYSIS', [
+                    f"H1 Count: {h1.count}",
+                    f"Status: {h1.status}",
+                    *(f"H1 #{i}: {h1_text}" for i, h1_text in enumerate(h1.texts, 1))
+                ]),
+                ('IMAGES ANALYSIS', [
+                    f"Total Images: {img.total_images}",
+                    f"With ALT Tags: {img.with_alt}",
+                    f"Missing ALT Tags: {img.missing_alt}"
+                ]),
+                ('SCHEMA MARKUP', schema_lines),
+                ('PAGESPEED PERFORMANCE', pagespeed_lines)
+            ]
+            
+            # One wrapped text block per section
+            for header, lines in sections:
+                pdf.set_font('Helvetica', 'B', 12)
+                pdf.cell(0, 8, header, 0, 1)
+                pdf.set_font('Helvetica', '', 10)
+                pdf.ln(2)
+                pdf.multi_cell(0, 6, '\n'.join(lines), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+                pdf.ln(6)
             
             # Footer
-            pdf.ln(15)
+            pdf.ln(9)
             pdf.set_font('Helvetica', 'I', 8)
             pdf.cell(0, 6, 'Generated by SEO Audit Tool | Sysdevcode', 0, 1, 'C')
             pdf.cell(0, 6, f"{results['audit_date']}", 0, 1, 'C')  
@@ -564,21 +728,30 @@ class SEOAuditTool:
             # Add logo image at bottom center
 
             try:
-                logo_path = "lo.png"  # Or your uploaded path: /mnt/data/89a5b77a-d21e-454f-8468-c17a034f4053.png
+                logo_bytes = _load_logo()
                 logo_width = 65  # Adjust width as needed
                 page_width = pdf.w  # A4 is 210mm
                 x_position = (page_width - logo_width) / 2
                 y_position = pdf.get_y() + 10
 
-                if os.path.exists(logo_path):
-                    pdf.image(logo_path, x=x_position, y=y_position, w=logo_width)
+                if logo_bytes:
+                    pdf.image(io.BytesIO(logo_bytes), x=x_position, y=y_position, w=logo_width)
             except Exception as e:
                 print(f"⚠️ Failed to load logo image: {e}")
 
 
             
-            # Save PDF
-            pdf.output(filename)
+            # Render in memory, then swap the finished file into place so a
+            # failed run never leaves a partial report behind
+            pdf_bytes = pdf.output()
+            temp_filename = f"{filename}.tmp"
+            try:
+                with open(temp_filename, 'wb') as f:
+                    f.write(pdf_bytes)
+                os.replace(temp_filename, filename)
+            finally:
+                if os.path.exists(temp_filename):
+                    os.remove(temp_filename)
             return True
             
         except Exception as e:
@@ -613,16 +786,44 @@ class SEOAuditTool:
                 print(f"❌ An error occurred: {str(e)}")
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options; no options starts the interactive menu"""
+    parser = argparse.ArgumentParser(description="SEO Audit Tool - run without options for the interactive menu")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', help="website URL to audit (with http:// or https://)")
+    target.add_argument('--batch', metavar='CSV', help="CSV file of url,keyword rows to audit")
+    parser.add_argument('--keyword', help="keyword to analyze (required with --url)")
+    parser.add_argument('--api-key', help="Google PageSpeed Insights API key")
+    parser.add_argument('--output', help="PDF report path with --url, or report directory with --batch")
+    
+    args = parser.parse_args(argv)
+    if args.url and not args.keyword:
+        parser.error("--keyword is required with --url")
+    return args
+
+
 def main():
     """Entry point of the application"""
+    args = parse_args()
+    
     try:
         tool = SEOAuditTool()
-        tool.run()
+        tool.api_key = args.api_key
+        
+        if args.batch:
+            sys.exit(0 if tool.run_batch(args.batch, args.output) else 1)
+        elif args.url:
+            sys.exit(0 if tool.run_audit_once(args.url, args.keyword, args.output) else 1)
+        else:
+            tool.run()
     except KeyboardInterrupt:
         print("\n\n👋 Application interrupted by user. Goodbye!")
     except Exception as e:
         print(f"❌ Fatal error: {str(e)}")
         print("Please check your Python environment and try again.")
+        # Scripted runs must report the failure through the exit status
+        if args.url or args.batch:
+            sys.exit(1)
 
 
 if __name__ == "__main__":